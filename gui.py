@@ -6,24 +6,193 @@ import sys
 import os
 import logging
 import json
+import multiprocessing
+import queue
+import re
 import traceback
-from pathlib import Path
+from collections import deque
+from logging.handlers import QueueListener
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                           QHBoxLayout, QLabel, QPushButton, QFileDialog,
-                           QFrame, QScrollArea, QLineEdit, QSplitter)
+                           QHBoxLayout, QLabel, QPushButton,
+                           QFrame, QScrollArea, QLineEdit, QSplitter, QGridLayout)
 from PyQt6.QtGui import (QFont, QFontMetrics, QDragEnterEvent, QDropEvent,
                        QCursor, QPainter, QColor, QIntValidator, QPixmap)
-from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QObject, QSize, QPoint,
+from PyQt6.QtCore import (Qt, QEvent, QThread, pyqtSignal, QObject, QSize, QPoint, QRect,
                         QPropertyAnimation, QEasingCurve, QVariantAnimation,
-                        pyqtProperty, QTimer)
-from PyQt6.QtSvg import QSvgRenderer
+                        pyqtProperty, pyqtSlot, QTimer, QThreadPool, QRunnable)
 
-# Import your existing components
-from settings import Settings
-from splitter import DocumentSplitter
+# Import your existing components. splitter (python-docx/lxml), version and
+# QFileDialog are imported where first used so startup and the first-run screen
+# don't pay for them.
+from settings import Settings, DEFAULT_OUTPUT_FOLDER
 from utils import setup_logging
-import version
+
+# Supported document extensions (lowercase)
+_VALID_EXTS = ('.docx', '.txt')
+
+# Alignment of the parts/progress text on file cards
+_RIGHT_VCENTER = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# First-run settings file; only the output folder varies (filled in JSON-escaped).
+# Always preserve formatting and process all files.
+_DEFAULT_SETTINGS_TEMPLATE = (
+    '{"max_words":100000,"output_folder":%s,'
+    '"preserve_formatting":true,"skip_under_limit":false}'
+)
+
+# Characters dropped from output folder names (keeps letters, digits, space, '-', '_')
+_FOLDER_NAME_STRIP_RE = re.compile(r'[^\w \-]+')
+
+# Application-wide dark theme. Applied once to the QApplication so Qt parses it a
+# single time; widgets opt in through object names and dynamic "state" properties.
+APP_QSS = """
+    QWidget {
+        background-color: transparent;
+        color: #ffffff;
+        font-family: Arial, sans-serif;
+    }
+    QMainWindow, QDialog {
+        background-color: #121212;
+    }
+    QMenu {
+        background-color: #1e1e1e;
+    }
+    QToolTip {
+        background-color: #2a2a2a;
+        color: #ffffff;
+        border: 1px solid #444444;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #1e1e1e;
+        width: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #555555;
+        min-height: 20px;
+        border-radius: 3px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+        height: 0px;
+    }
+    QSplitter::handle {
+        background-color: #2a2a2a;
+        width: 1px;
+    }
+
+    QPushButton#animatedButton {
+        color: #ffffff;
+        background-color: transparent;
+        border: none;
+        padding: 6px 12px;
+        font-size: 13px;
+        text-align: center;
+    }
+    QPushButton#animatedButton[primary="true"] {
+        font-weight: 600;
+    }
+
+    QLabel#sectionHeader, QLabel#settingsHeader {
+        font-size: 15px;
+        font-weight: 600;
+        margin-bottom: 4px;
+    }
+    QLabel#settingsHeader {
+        margin-top: 10px;
+    }
+    QLabel#settingLabel {
+        color: #aaaaaa;
+        font-size: 13px;
+    }
+    QWidget#wordInputContainer {
+        background-color: #1e1e1e;
+        border-radius: 6px;
+    }
+    QLineEdit#wordInput {
+        font-size: 13px;
+        border: none;
+        padding: 0;
+    }
+
+    QLabel#dropLabel {
+        color: #888888;
+        font-size: 14px;
+        font-weight: 400;
+        padding-top: 0;
+    }
+    QLabel#dropLabel[state="active"] {
+        color: #ffffff;
+    }
+
+    QLabel#cardFileName {
+        font-size: 13px;
+        font-weight: 500;
+    }
+    QLabel#cardStatus {
+        color: #888888;
+        font-size: 12px;
+    }
+    QLabel#cardProgress {
+        color: #0078d4;
+        font-size: 14px;
+        font-weight: 600;
+        padding-right: 4px;
+    }
+    QLabel#cardStatus[state="processing"] {
+        color: #0078d4;
+    }
+    QLabel#cardStatus[state="completed"], QLabel#cardProgress[state="completed"] {
+        color: #2fcc71;
+    }
+    QLabel#cardStatus[state="error"], QLabel#cardProgress[state="error"] {
+        color: #e74c3c;
+    }
+
+    QLabel#firstRunTitle {
+        font-size: 16px;
+        font-weight: 500;
+    }
+    QLabel#firstRunPath {
+        font-size: 14px;
+        background-color: #1a1a1a;
+        border-radius: 6px;
+        padding: 8px 12px;
+    }
+    QLabel#firstRunNote {
+        color: #888888;
+        font-size: 13px;
+        font-style: italic;
+    }
+"""
+
+
+# Shared pointing-hand cursor, created on first use (needs a QApplication)
+_HAND_CURSOR = None
+
+
+def hand_cursor():
+    """Return the shared pointing-hand cursor used by all buttons."""
+    global _HAND_CURSOR
+    if _HAND_CURSOR is None:
+        _HAND_CURSOR = QCursor(Qt.CursorShape.PointingHandCursor)
+    return _HAND_CURSOR
+
+
+def _set_style_state(widget, state):
+    """Switch a widget's QSS "state" property and re-polish it (no stylesheet reparse)."""
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 
 
 class ElegantFrame(QFrame):
@@ -37,10 +206,6 @@ class ElegantFrame(QFrame):
         self.has_border = border
         self.border_color = border_color or "#333333"
         self.border_style = border_style
-        self.setStyleSheet(f"""
-            background-color: transparent;
-            border: none;
-        """)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
     def paintEvent(self, event):
@@ -105,219 +270,417 @@ class DownArrowWidget(QWidget):
         painter.drawPolygon(points)
 
 
-class Worker(QObject):
-    """Worker thread to process files in the background."""
-    fileProgress = pyqtSignal(str, int)  # filepath, progress percentage
-    fileComplete = pyqtSignal(str, int)  # filepath, parts created
-    fileError = pyqtSignal(str, str)     # filepath, error message
-    finished = pyqtSignal()
+@dataclass(frozen=True)
+class FileJob:
+    """A file queued for splitting, with its path components parsed once."""
+    path: str
+    basename: str
+    stem: str
+    ext: str
+
+    @classmethod
+    def from_path(cls, path):
+        """Build a job from a file path."""
+        basename = os.path.basename(path)
+        stem, ext = os.path.splitext(basename)
+        return cls(path, basename, stem, ext)
+
+
+class SettingsWriter(QRunnable):
+    """Writes a settings snapshot to disk on a pool thread."""
 
-    def __init__(self, splitter, files, settings):
+    def __init__(self, settings, snapshot):
         super().__init__()
-        self.splitter = splitter
-        self.files = files
         self.settings = settings
-        self.logger = logging.getLogger(__name__)
+        self.snapshot = snapshot
 
-    def process(self):
-        """Process files with the document splitter."""
-        try:
-            for file_path in self.files:
-                try:
-                    # Create an output folder for this file
-                    self._prepare_output_folder(file_path)
-
-                    # Process the file
-                    result = self.splitter.process_file(
-                        file_path,
-                        callback=lambda status, progress, message:
-                            self.fileProgress.emit(file_path, progress)
-                    )
-
-                    # Report completion
-                    if result["success"]:
-                        self.fileComplete.emit(file_path, result["parts_created"])
-                    else:
-                        self.fileError.emit(file_path, result["message"])
-                except Exception as e:
-                    self.logger.exception(f"Error processing file {file_path}: {str(e)}")
-                    self.fileError.emit(file_path, str(e))
+    def run(self):
+        """Save the snapshot."""
+        self.settings.save(self.snapshot)
 
-        except Exception as e:
-            self.logger.exception(f"Error in processing thread: {str(e)}")
-        finally:
-            self.finished.emit()
 
-    def _prepare_output_folder(self, file_path):
-        """Create a dedicated output folder for a file."""
+class FolderCreator(QRunnable):
+    """Creates a folder on a pool thread (slow on network drives)."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def run(self):
+        """Create the folder and any missing parents."""
         try:
-            # Get base filename without extension
-            basename = os.path.basename(file_path)
-            filename, _ = os.path.splitext(basename)
+            os.makedirs(self.path, exist_ok=True)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Failed to create output folder: {str(e)}")
+
 
-            # Create a clean folder name
-            folder_name = "".join(c for c in filename if c.isalnum() or c in [' ', '-', '_']).strip()
-            if not folder_name:
-                folder_name = "Document"
+class Worker(QObject):
+    """Long-lived worker that dispatches submitted batches of files to a process pool."""
+    # One signal per drain tick:
+    #   dict - filepath -> latest progress percentage for files still running
+    #   list - (filepath, parts created, error message or None) per finished file
+    updatesReady = pyqtSignal(dict, list)
 
-            # Create the path within the main output folder
-            base_output_dir = self.settings.get("output_folder")
-            output_dir = os.path.join(base_output_dir, folder_name)
+    def __init__(self, settings):
+        super().__init__()
+        self.settings = settings
+        self.logger = logging.getLogger(__name__)
+        from splitter import PROGRESS_INTERVAL
+
+        # Splitting is CPU-bound Python, so files run in separate processes.
+        # Created on first use so nothing is spawned until files arrive.
+        self._executor = None
+        self._progress_queue = None
+        # Log records from pool processes, written here by a listener thread
+        self._log_queue = None
+        self._log_listener = None
+        # Future -> file path for files still being split
+        self._pending = {}
+        # (path, settings, output folder) waiting for a free slot. Only a couple of
+        # files per core are handed to the pool at once, so the first file starts
+        # straight away and large drops aren't all pickled into the pool's queue.
+        self._backlog = deque()
+        self._max_in_flight = (os.cpu_count() or 1) * 2
+
+        # Polls progress and finished files while work is in flight. None of the
+        # timers here need millisecond accuracy, so they let the OS coalesce wakeups.
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._drain_timer.setInterval(int(PROGRESS_INTERVAL * 1000))
+        self._drain_timer.timeout.connect(self._drain)
+
+        # Output folder per file path, filled in before processing starts
+        self._folder_map = {}
+        # Casefolded names in the output folder, snapshotted once per batch
+        self._existing_names = set()
+
+    def _get_executor(self):
+        """Create the process pool on first use."""
+        if self._executor is None:
+            from splitter import init_process_worker
+            # Always spawn: forking this already multi-threaded Qt process is
+            # unsafe, and spawn is what Windows and macOS use anyway
+            mp_context = multiprocessing.get_context("spawn")
+            self._progress_queue = mp_context.Queue()
+            if self._log_listener is None:
+                # Only this process writes (and rotates) manusplit.log
+                self._log_queue = mp_context.Queue()
+                self._log_listener = QueueListener(
+                    self._log_queue, *logging.getLogger().handlers,
+                    respect_handler_level=True
+                )
+                self._log_listener.start()
+            self._executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=mp_context,
+                initializer=init_process_worker,
+                initargs=(self._progress_queue, self._log_queue)
+            )
+        return self._executor
+
+    @pyqtSlot(list)
+    def submit(self, jobs):
+        """Dispatch a batch of files to the process pool.
+
+        Batches are delivered through a queued connection, so the worker
+        thread's event queue serializes them in submission order.
+        """
+        self._folder_map = {}
 
-            # Handle duplicate folder names
-            count = 1
-            original_output_dir = output_dir
-            while os.path.exists(output_dir):
-                output_dir = f"{original_output_dir}_{count}"
-                count += 1
+        try:
+            # Create every output folder up front so pool processes do no mkdir work
+            self._prepare_all_folders(jobs)
 
-            # Create the folder
-            os.makedirs(output_dir, exist_ok=True)
+            # Only plain settings are sent to the pool processes
+            settings = self.settings.to_dict()
+            self._backlog.extend((job.path, settings, self._folder_map[job.path]) for job in jobs)
+            self._fill()
 
-            # Update the splitter to use this folder
-            self.splitter.current_output_folder = output_dir
+            if self._pending and not self._drain_timer.isActive():
+                self._drain_timer.start()
 
         except Exception as e:
+            self.logger.exception(f"Error dispatching files: {str(e)}")
+            # Fail everything that didn't reach the pool, including files of
+            # this batch that never made it into the backlog
+            results = self._abandon_backlog(e)
+            failed = {file_path for file_path, _, _ in results}
+            failed.update(self._pending.values())
+            results.extend((job.path, 0, str(e)) for job in jobs if job.path not in failed)
+            self.updatesReady.emit({}, results)
+
+            # Files already in the pool still report through the drain timer
+            if self._pending and not self._drain_timer.isActive():
+                self._drain_timer.start()
+
+    def _abandon_backlog(self, error):
+        """Drop every file waiting for the pool and return their error results."""
+        if isinstance(error, BrokenProcessPool) and self._executor is not None:
+            # Let the next batch start a fresh pool
+            self._discard_executor()
+        results = [(file_path, 0, str(error)) for file_path, _, _ in self._backlog]
+        self._backlog.clear()
+        return results
+
+    def _discard_executor(self):
+        """Drop a broken pool so the next dispatch creates a new one."""
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    def _fill(self):
+        """Hand backlog files to the pool until the in-flight limit is reached.
+
+        If a pool process has died the pool rejects all new work; backlog files
+        (never dispatched) then go to a fresh pool instead of failing.
+        """
+        from splitter import split_file
+        executor = self._get_executor()
+        while self._backlog and len(self._pending) < self._max_in_flight:
+            file_path, settings, output_folder = self._backlog[0]
+            try:
+                future = executor.submit(split_file, file_path, settings, output_folder)
+            except BrokenProcessPool:
+                self.logger.warning("Process pool broken, starting a new one")
+                self._discard_executor()
+                executor = self._get_executor()
+                future = executor.submit(split_file, file_path, settings, output_folder)
+            self._backlog.popleft()
+            self._pending[future] = file_path
+
+    @pyqtSlot()
+    def _drain(self):
+        """Forward queued progress and finished results to the GUI.
+
+        Declared as a slot so the timer connection follows the worker to its
+        thread; a plain method connected before moveToThread runs on the GUI thread.
+        """
+        # Keep only the latest progress per file for this tick
+        latest = {}
+        try:
+            while True:
+                file_path, progress = self._progress_queue.get_nowait()
+                latest[file_path] = progress
+        except queue.Empty:
+            pass
+
+        # Collect files finished this tick
+        results = []
+        for future in [f for f in self._pending if f.done()]:
+            file_path = self._pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                self.logger.exception(f"Error processing file {file_path}: {str(e)}")
+                results.append((file_path, 0, str(e)))
+                continue
+
+            if result["success"]:
+                results.append((file_path, result["parts_created"], None))
+            else:
+                results.append((file_path, 0, result["message"]))
+
+        if self._backlog:
+            try:
+                self._fill()
+            except Exception as e:
+                self.logger.exception(f"Error dispatching files: {str(e)}")
+                results.extend(self._abandon_backlog(e))
+
+        # Progress for files that have finished (including this tick) is dropped.
+        # Everything crosses to the GUI thread as one queued signal per tick.
+        active = set(self._pending.values())
+        progress = {path: value for path, value in latest.items() if path in active}
+        if progress or results:
+            self.updatesReady.emit(progress, results)
+
+        if not self._pending:
+            self._drain_timer.stop()
+
+    @pyqtSlot()
+    def shutdown(self):
+        """Stop dispatching and shut down the pool, waiting only for files in progress.
+
+        Runs on the worker thread (the window invokes it through a blocking queued
+        connection), so it never overlaps a drain tick.
+        """
+        self._drain_timer.stop()
+        if self._backlog:
+            # Queued files are dropped rather than split while the window waits
+            self.logger.info(f"Cancelled {len(self._backlog)} queued files on exit")
+            self._backlog.clear()
+        if self._executor is not None:
+            # Files handed to the pool but not yet started are cancelled too
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._log_listener is not None:
+            # Writes any records the pool processes sent before exiting
+            self._log_listener.stop()
+
+    def _prepare_all_folders(self, jobs):
+        """Create the output folders for every file in the batch."""
+        base_output_dir = self.settings.get("output_folder")
+
+        # Make sure the main output folder exists once, not once per file
+        try:
+            os.makedirs(base_output_dir, exist_ok=True)
+        except OSError as e:
             self.logger.error(f"Error creating output folder: {str(e)}")
-            # Fall back to main output folder
-            self.splitter.current_output_folder = self.settings.get("output_folder")
+
+        # One directory read replaces a stat per duplicate-name probe.
+        # Names are casefolded to match case-insensitive filesystems.
+        try:
+            with os.scandir(base_output_dir) as entries:
+                self._existing_names = {entry.name.casefold() for entry in entries}
+        except OSError:
+            self._existing_names = set()
+
+        # Names are picked from the snapshot (set lookups only) and created with a
+        # plain mkdir - the main folder already exists. A name taken since the
+        # snapshot raises FileExistsError and the next suffix is tried, so two
+        # files never share a folder and no stat precedes each mkdir.
+        for job in jobs:
+            output_dir = self._plan_output_folder(job, base_output_dir)
+            while True:
+                try:
+                    os.mkdir(output_dir)
+                    break
+                except FileExistsError:
+                    output_dir = self._plan_output_folder(job, base_output_dir)
+                except OSError as e:
+                    self.logger.error(f"Error creating output folder: {str(e)}")
+                    # Fall back to main output folder
+                    output_dir = base_output_dir
+                    break
+            self._folder_map[job.path] = output_dir
+
+    def _plan_output_folder(self, job, base_output_dir):
+        """Pick a unique output folder path for a file (without creating it)."""
+        # Create a clean folder name from the base filename without extension
+        folder_name = _FOLDER_NAME_STRIP_RE.sub("", job.stem).strip() or "Document"
+
+        # Handle duplicate folder names
+        count = 1
+        candidate = folder_name
+        while candidate.casefold() in self._existing_names:
+            candidate = f"{folder_name}_{count}"
+            count += 1
+
+        self._existing_names.add(candidate.casefold())
+        return os.path.join(base_output_dir, candidate)
 
 
 class FileCard(QWidget):
     """An elegantly designed file card."""
 
-    def __init__(self, file_path, parent=None):
+    # Badge font shared by every card, built on first paint
+    _badge_font = None
+    # Fixed badge colors, parsed once instead of on every repaint
+    _BADGE_COLOR = QColor("#2a2a2a")
+    _BADGE_TEXT_COLOR = QColor("#ffffff")
+
+    def __init__(self, job, display_name=None, parent=None):
         super().__init__(parent)
-        self.file_path = file_path
-        self.basename = os.path.basename(file_path)
-        self.extension = os.path.splitext(self.basename)[1][1:].upper()
+        self.job = job
+        self.display_name = display_name
+        self.file_path = job.path
+        self.basename = job.basename
+        self.extension = job.ext[1:].upper()
+        self.badge_text = self.extension[:3]  # Limit to 3 chars
         self.parts_count = 0
         self.is_processing = False
         self.progress = 0
+        self.bg_color = "#1a1a1a"
 
         self.setup_ui()
 
     def setup_ui(self):
         """Set up the file card UI."""
-        # Main layout with larger margins for cleaner look
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(12)
+        # Single grid layout - left margin leaves room for the painted type badge
+        layout = QGridLayout(self)
+        layout.setContentsMargins(58, 8, 12, 8)
+        layout.setHorizontalSpacing(12)
+        layout.setVerticalSpacing(2)
 
         # Base widget is transparent
-        self.setStyleSheet("""
-            background-color: transparent;
-            color: #ffffff;
-        """)
-
-        # Create background frame
-        self.bg_frame = ElegantFrame(self, radius=8, bg_color="#1a1a1a")
-        self.bg_frame.setGeometry(self.rect())
-
-        # File type indicator
-        type_container = QWidget()
-        type_container.setFixedSize(34, 34)
-        type_container.setStyleSheet("""
-            background-color: #2a2a2a;
-            border-radius: 17px;
-        """)
-
-        type_layout = QVBoxLayout(type_container)
-        type_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.type_label = QLabel(self.extension[:3])  # Limit to 3 chars
-        self.type_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.type_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 11px;
-            font-weight: 600;
-            background-color: transparent;
-        """)
-        type_layout.addWidget(self.type_label)
-
-        layout.addWidget(type_container)
-
-        # File details container
-        details_widget = QWidget()
-        details_layout = QVBoxLayout(details_widget)
-        details_layout.setContentsMargins(0, 0, 0, 0)
-        details_layout.setSpacing(2)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
         # Filename
-        self.filename_label = QLabel(self._truncate_filename(self.basename, 250))
-        self.filename_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 13px;
-            font-weight: 500;
-            background-color: transparent;
-        """)
+        if self.display_name is None:
+            self.display_name = self.truncate_all([self.job], QFontMetrics(self.font()))[0]
+        self.filename_label = QLabel(self.display_name)
+        self.filename_label.setObjectName("cardFileName")
         self.filename_label.setToolTip(self.basename)
-        details_layout.addWidget(self.filename_label)
+        layout.addWidget(self.filename_label, 0, 0)
 
         # Status line
         self.status_label = QLabel("Waiting")
-        self.status_label.setStyleSheet("""
-            color: #888888;
-            font-size: 12px;
-            background-color: transparent;
-        """)
-        details_layout.addWidget(self.status_label)
+        self.status_label.setObjectName("cardStatus")
+        layout.addWidget(self.status_label, 1, 0)
 
-        layout.addWidget(details_widget, 1)  # Stretch
+        layout.setColumnStretch(0, 1)  # Stretch
 
         # Progress count/parts
         self.progress_label = QLabel("")
-        self.progress_label.setStyleSheet("""
-            color: #0078d4;
-            font-size: 14px;
-            font-weight: 600;
-            background-color: transparent;
-            padding-right: 4px;
-        """)
-        self.progress_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self.progress_label.setObjectName("cardProgress")
+        self.progress_label.setAlignment(_RIGHT_VCENTER)
         self.progress_label.setFixedWidth(70)
-        layout.addWidget(self.progress_label)
+        layout.addWidget(self.progress_label, 0, 1, 2, 1)
 
-        # Update on resize
-        self.resizeEvent = self._on_resize
-
-    def _on_resize(self, event):
-        """Handle resize events."""
-        # Update frame size
-        self.bg_frame.setGeometry(self.rect())
-
-    def _truncate_filename(self, filename, max_width):
-        """Truncate filename to fit in the available width."""
-        metrics = QFontMetrics(self.font())
-        if metrics.horizontalAdvance(filename) <= max_width:
-            return filename
+    def paintEvent(self, event):
+        """Paint the rounded background and file type badge (no child widgets needed)."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
 
-        # Truncate the middle
-        base, ext = os.path.splitext(filename)
-        while metrics.horizontalAdvance(f"{base[:-3]}...{ext}") > max_width and len(base) > 10:
-            base = base[:-1]
+        # Card background
+        painter.setBrush(QColor(self.bg_color))
+        painter.drawRoundedRect(self.rect(), 8, 8)
 
-        return f"{base[:-3]}...{ext}"
+        # File type badge
+        badge = QRect(12, (self.height() - 34) // 2, 34, 34)
+        painter.setBrush(self._BADGE_COLOR)
+        painter.drawEllipse(badge)
+
+        if FileCard._badge_font is None:
+            font = QFont(self.font())
+            font.setPixelSize(11)
+            font.setWeight(QFont.Weight.DemiBold)
+            FileCard._badge_font = font
+        painter.setFont(FileCard._badge_font)
+        painter.setPen(self._BADGE_TEXT_COLOR)
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, self.badge_text)
+
+    @staticmethod
+    def truncate_all(jobs, metrics, max_width=250):
+        """Truncate each job's filename to fit max_width, keeping the extension visible."""
+        names = []
+        for job in jobs:
+            if metrics.horizontalAdvance(job.basename) <= max_width:
+                names.append(job.basename)
+            else:
+                # Elide the stem in one call, leaving room for the extension
+                stem_width = max_width - metrics.horizontalAdvance(job.ext)
+                names.append(metrics.elidedText(job.stem, Qt.TextElideMode.ElideRight, stem_width) + job.ext)
+        return names
 
     def update_progress(self, progress):
         """Update processing progress."""
+        # Nothing to relabel or repaint if the value hasn't moved
+        if self.is_processing and progress == self.progress:
+            return
         self.progress = progress
-        self.is_processing = True
 
-        # Update labels
-        self.status_label.setText("Processing")
-        self.status_label.setStyleSheet("""
-            color: #0078d4;
-            font-size: 12px;
-            background-color: transparent;
-        """)
+        # Update labels - restyle only when entering the processing state
+        if not self.is_processing:
+            self.is_processing = True
+            self.status_label.setText("Processing")
+            _set_style_state(self.status_label, "processing")
 
         self.progress_label.setText(f"{progress}%")
 
         # Progress-colored background - subtle gradient
         color = self._interpolate_color("#1a3a5a", "#1a1a1a", progress/100)
-        self.bg_frame.bg_color = color
-        self.bg_frame.update()
+        self.bg_color = color
+        self.update()
 
     def set_completed(self, parts_count):
         """Mark as completed with parts count."""
@@ -326,24 +689,14 @@ class FileCard(QWidget):
 
         # Update labels
         self.status_label.setText("Completed")
-        self.status_label.setStyleSheet("""
-            color: #2fcc71;
-            font-size: 12px;
-            background-color: transparent;
-        """)
+        _set_style_state(self.status_label, "completed")
 
         self.progress_label.setText(f"{parts_count} parts")
-        self.progress_label.setStyleSheet("""
-            color: #2fcc71;
-            font-size: 14px;
-            font-weight: 600;
-            background-color: transparent;
-            padding-right: 4px;
-        """)
+        _set_style_state(self.progress_label, "completed")
 
         # Reset background with slight green tint
-        self.bg_frame.bg_color = "#1a291f"
-        self.bg_frame.update()
+        self.bg_color = "#1a291f"
+        self.update()
 
     def set_error(self, error_message):
         """Mark as error with message."""
@@ -351,25 +704,15 @@ class FileCard(QWidget):
 
         # Update labels
         self.status_label.setText("Error")
-        self.status_label.setStyleSheet("""
-            color: #e74c3c;
-            font-size: 12px;
-            background-color: transparent;
-        """)
+        _set_style_state(self.status_label, "error")
 
         self.progress_label.setText("Failed")
-        self.progress_label.setStyleSheet("""
-            color: #e74c3c;
-            font-size: 14px;
-            font-weight: 600;
-            background-color: transparent;
-            padding-right: 4px;
-        """)
+        _set_style_state(self.progress_label, "error")
         self.status_label.setToolTip(error_message)
 
         # Error background
-        self.bg_frame.bg_color = "#2a1a1a"
-        self.bg_frame.update()
+        self.bg_color = "#2a1a1a"
+        self.update()
 
     def _interpolate_color(self, color1, color2, factor):
         """Interpolate between two colors."""
@@ -388,7 +731,7 @@ class AnimatedButton(QPushButton):
 
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setCursor(hand_cursor())
 
         # Animation properties
         self._animation_progress = 0.0
@@ -402,16 +745,7 @@ class AnimatedButton(QPushButton):
         self._is_hovered = False
 
         # Set transparent background so we can paint our own
-        self.setStyleSheet("""
-            QPushButton {
-                color: #ffffff;
-                background-color: transparent;
-                border: none;
-                padding: 6px 12px;
-                font-size: 13px;
-                text-align: center;
-            }
-        """)
+        self.setObjectName("animatedButton")
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
     def _get_animation_progress(self):
@@ -487,17 +821,7 @@ class ElegantButton(AnimatedButton):
 
         # Set font weight
         if primary:
-            self.setStyleSheet("""
-                QPushButton {
-                    color: #ffffff;
-                    background-color: transparent;
-                    border: none;
-                    padding: 6px 12px;
-                    font-size: 13px;
-                    font-weight: 600;
-                    text-align: center;
-                }
-            """)
+            self.setProperty("primary", True)
 
     def paintEvent(self, event):
         """Custom paint event to draw animated rounded button."""
@@ -632,11 +956,7 @@ class WordLimitInput(QWidget):
 
         # Label
         self.label = QLabel("Max words:")
-        self.label.setStyleSheet("""
-            color: #aaaaaa;
-            font-size: 13px;
-            background-color: transparent;
-        """)
+        self.label.setObjectName("settingLabel")
         layout.addWidget(self.label)
 
         # Spacer to push input to the right, aligned with Save To
@@ -645,10 +965,7 @@ class WordLimitInput(QWidget):
         # Input field container with appropriate width
         input_container = QWidget()
         input_container.setFixedSize(120, 28)  # Appropriate width for content
-        input_container.setStyleSheet("""
-            background-color: #1e1e1e;
-            border-radius: 6px;
-        """)
+        input_container.setObjectName("wordInputContainer")
 
         input_layout = QHBoxLayout(input_container)
         input_layout.setContentsMargins(4, 0, 4, 0)
@@ -656,13 +973,7 @@ class WordLimitInput(QWidget):
 
         # Text input for words
         self.input = QLineEdit(str(self.value))
-        self.input.setStyleSheet("""
-            color: #ffffff;
-            font-size: 13px;
-            background-color: transparent;
-            border: none;
-            padding: 0;
-        """)
+        self.input.setObjectName("wordInput")
         self.input.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Only allow integers
@@ -697,6 +1008,9 @@ class WordLimitInput(QWidget):
 class ManusplitApp(QMainWindow):
     """Redesigned horizontal layout UI for Manusplit."""
 
+    jobsSubmitted = pyqtSignal(list)  # list of FileJob for the worker
+    shutdownRequested = pyqtSignal()  # runs Worker.shutdown on the worker thread
+
     def __init__(self, settings):
         super().__init__()
         self.settings = settings
@@ -705,11 +1019,9 @@ class ManusplitApp(QMainWindow):
         self.settings.set("preserve_formatting", True)
         self.settings.set("skip_under_limit", False)
 
-        self.splitter = DocumentSplitter(settings)
-        self.splitter.current_output_folder = settings.get("output_folder")
-
         self.logger = logging.getLogger(__name__)
         self.processed_files = {}  # Map filepath to FileCard widgets
+        self._hidden_progress = {}  # Latest progress per file received while minimized
 
         # Set up the UI
         self.setWindowTitle("Manusplit")
@@ -719,45 +1031,83 @@ class ManusplitApp(QMainWindow):
         # Start with larger size
         self.resize(800, 500)  # Wider default
 
-        # Set app style - darker theme
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #121212;
-                color: #ffffff;
-                font-family: Arial, sans-serif;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #1e1e1e;
-                width: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #555555;
-                min-height: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QSplitter::handle {
-                background-color: #2a2a2a;
-                width: 1px;
-            }
-        """)
+        # Dark theme comes from the application-wide APP_QSS set in main()
 
         self.setup_ui()
 
         # Enable drag and drop for main window
         self.setAcceptDrops(True)
-
-        # Worker thread
-        self.worker_thread = None
+        # Whether the drop zone currently shows its hover look
+        self._drop_highlighted = False
+
+        # Dropped files are collected here and processed shortly after the drop
+        # returns, so bursts of drops become a single batch
+        self._pending_drops = []
+        self._drop_timer = QTimer(self)
+        self._drop_timer.setSingleShot(True)
+        self._drop_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._drop_timer.setInterval(50)
+        self._drop_timer.timeout.connect(self._flush_pending_drops)
+
+        # Settings are saved shortly after the last change, off the UI thread.
+        # A single writer thread keeps writes in order.
+        self._settings_pool = QThreadPool(self)
+        self._settings_pool.setMaxThreadCount(1)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._save_timer.setInterval(200)
+        self._save_timer.timeout.connect(self._flush_settings)
+
+        # Persistent worker thread - batches are queued to it as files arrive
+        self._start_worker()
+
+    def _start_worker(self):
+        """Create the worker and its thread once for the lifetime of the window."""
+        self.worker_thread = QThread()
+        self.worker = Worker(self.settings)
+        self.worker.moveToThread(self.worker_thread)
+
+        # Connect signals
+        self.jobsSubmitted.connect(self.worker.submit)
+        # Blocks the emitting (GUI) thread until the worker has shut down
+        self.shutdownRequested.connect(
+            self.worker.shutdown, Qt.ConnectionType.BlockingQueuedConnection
+        )
+        self.worker.updatesReady.connect(self.apply_worker_updates)
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+
+        # Start thread
+        self.worker_thread.start()
+
+    def changeEvent(self, event):
+        """Catch up on progress held back while the window was minimized."""
+        super().changeEvent(event)
+        if (event.type() == QEvent.Type.WindowStateChange
+                and self._hidden_progress and not self.isMinimized()):
+            progress, self._hidden_progress = self._hidden_progress, {}
+            self.apply_worker_updates(progress, [])
+
+    def closeEvent(self, event):
+        """Save pending settings and stop the worker thread once any running files complete.
+
+        Files still queued for the pool are cancelled; only files already being
+        split are waited for.
+        """
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_settings()
+        self._settings_pool.waitForDone()
+
+        self.shutdownRequested.emit()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        super().closeEvent(event)
 
     def setup_ui(self):
         """Set up the UI with horizontal layout."""
+        values = self.settings.view()
+
         # Main widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -779,12 +1129,7 @@ class ManusplitApp(QMainWindow):
 
         # Header for files
         files_header = QLabel("Files")
-        files_header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 15px;
-            font-weight: 600;
-            margin-bottom: 4px;
-        """)
+        files_header.setObjectName("sectionHeader")
         left_layout.addWidget(files_header)
 
         # Files list container with frame
@@ -817,12 +1162,7 @@ class ManusplitApp(QMainWindow):
 
         # Header for drop zone
         drop_header = QLabel("Add Files")
-        drop_header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 15px;
-            font-weight: 600;
-            margin-bottom: 4px;
-        """)
+        drop_header.setObjectName("sectionHeader")
         right_layout.addWidget(drop_header)
 
         # Drop zone with dashed border and down arrow
@@ -854,13 +1194,7 @@ class ManusplitApp(QMainWindow):
 
         # Drop label - move closer to arrow
         self.drop_label = QLabel("Drop .docx or .txt files here")
-        self.drop_label.setStyleSheet("""
-            color: #888888;
-            font-size: 14px;
-            font-weight: 400;
-            background-color: transparent;
-            padding-top: 0;
-        """)
+        self.drop_label.setObjectName("dropLabel")
         self.drop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         drop_content_layout.addWidget(self.drop_label)
 
@@ -880,13 +1214,7 @@ class ManusplitApp(QMainWindow):
 
         # Settings section
         settings_header = QLabel("Settings")
-        settings_header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 15px;
-            font-weight: 600;
-            margin-top: 10px;
-            margin-bottom: 4px;
-        """)
+        settings_header.setObjectName("settingsHeader")
         right_layout.addWidget(settings_header)
 
         # Settings container
@@ -896,7 +1224,7 @@ class ManusplitApp(QMainWindow):
         settings_layout.setSpacing(12)
 
         # Word limit setting with right-aligned input
-        self.word_limit = WordLimitInput(self.settings.get("max_words"))
+        self.word_limit = WordLimitInput(values["max_words"])
         self.word_limit.valueChanged.connect(self.update_word_limit)
         settings_layout.addWidget(self.word_limit)
 
@@ -908,18 +1236,14 @@ class ManusplitApp(QMainWindow):
 
         # Label
         save_to_label = QLabel("Save to:")
-        save_to_label.setStyleSheet("""
-            color: #aaaaaa;
-            font-size: 13px;
-            background-color: transparent;
-        """)
+        save_to_label.setObjectName("settingLabel")
         save_to_layout.addWidget(save_to_label)
 
         # Add stretch to push button to the right, aligned with word input
         save_to_layout.addStretch(1)
 
         # Path button - entire button is clickable with animation
-        self.destination_btn = DestinationButton(self.settings.get("output_folder"))
+        self.destination_btn = DestinationButton(values["output_folder"])
         self.destination_btn.clicked.connect(self.browse_destination)
         save_to_layout.addWidget(self.destination_btn)
 
@@ -938,83 +1262,86 @@ class ManusplitApp(QMainWindow):
         # Add splitter to main layout
         main_layout.addWidget(splitter)
 
-    def dragEnterEvent(self, event):
-        """Enhanced drag enter handling."""
-        if event.mimeData().hasUrls():
-            # Now using direct reference to drop container
+    def _set_drop_highlight(self, active):
+        """Switch the drop zone between idle and hover looks, only when it changes."""
+        if active == self._drop_highlighted:
+            return
+        self._drop_highlighted = active
+
+        if active:
             self.drop_container.bg_color = "#1a2a3a"
             self.drop_container.border_color = "#0078d4"
-            self.drop_container.update()
-
-            self.drop_label.setStyleSheet("""
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: 400;
-                background-color: transparent;
-                padding-top: 0;
-            """)
             self.arrow.color = "#0078d4"
-            self.arrow.update()
+        else:
+            self.drop_container.bg_color = "#171717"
+            self.drop_container.border_color = "#444444"
+            self.arrow.color = "#666666"
+        self.drop_container.update()
+        self.arrow.update()
+
+        # Re-polishing is the expensive part, so it's skipped for repeated events
+        _set_style_state(self.drop_label, "active" if active else "")
+
+    def dragEnterEvent(self, event):
+        """Enhanced drag enter handling."""
+        if event.mimeData().hasUrls():
+            self._set_drop_highlight(True)
             event.acceptProposedAction()
 
     def dragLeaveEvent(self, event):
         """Enhanced drag leave handling."""
-        # Now using direct reference to drop container
-        self.drop_container.bg_color = "#171717"
-        self.drop_container.border_color = "#444444"
-        self.drop_container.update()
-
-        self.drop_label.setStyleSheet("""
-            color: #888888;
-            font-size: 14px;
-            font-weight: 400;
-            background-color: transparent;
-            padding-top: 0;
-        """)
-        self.arrow.color = "#666666"
-        self.arrow.update()
+        self._set_drop_highlight(False)
 
     def dropEvent(self, event):
         """Enhanced drop handling."""
         if event.mimeData().hasUrls():
-            # Now using direct reference to drop container
-            self.drop_container.bg_color = "#171717"
-            self.drop_container.border_color = "#444444"
-            self.drop_container.update()
-
-            self.drop_label.setStyleSheet("""
-                color: #888888;
-                font-size: 14px;
-                font-weight: 400;
-                background-color: transparent;
-                padding-top: 0;
-            """)
-            self.arrow.color = "#666666"
-            self.arrow.update()
+            self._set_drop_highlight(False)
 
             # Get valid files
             valid_files = []
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if not os.path.isfile(file_path):
+                if not file_path:
                     continue
 
-                _, ext = os.path.splitext(file_path.lower())
-                if ext not in ['.docx', '.txt']:
-                    continue
-
-                # Only add if not already processed
-                if file_path not in self.processed_files:
+                # Cheap suffix test first - only the tail needs lowercasing.
+                # Documents are not stat'ed here; the splitter checks access itself.
+                # Already-processed and repeated files are filtered once in process_files.
+                if file_path[-5:].lower().endswith(_VALID_EXTS):
                     valid_files.append(file_path)
+                else:
+                    # Anything else may be a folder - list it with a single directory read
+                    valid_files.extend(self._documents_in_folder(file_path))
 
-            # Process valid files
+            # Queue valid files for the deferred batch
             if valid_files:
-                self.process_files(valid_files)
+                self._pending_drops.extend(valid_files)
+                if not self._drop_timer.isActive():
+                    self._drop_timer.start()
 
             event.acceptProposedAction()
 
+    def _flush_pending_drops(self):
+        """Process every file dropped since the timer started as one batch."""
+        files, self._pending_drops = self._pending_drops, []
+        self.process_files(files)
+
+    def _documents_in_folder(self, folder):
+        """List supported documents directly inside a dropped folder."""
+        try:
+            with os.scandir(folder) as entries:
+                # DirEntry.is_file() uses the type from the directory read - no extra stat
+                return sorted(
+                    entry.path for entry in entries
+                    if entry.name[-5:].lower().endswith(_VALID_EXTS) and entry.is_file()
+                )
+        except OSError:
+            # Not a folder (or not readable)
+            return []
+
     def browse_files(self):
         """Browse for files via dialog."""
+        from PyQt6.QtWidgets import QFileDialog
         files, _ = QFileDialog.getOpenFileNames(
             self,
             "Select Files to Split",
@@ -1023,77 +1350,104 @@ class ManusplitApp(QMainWindow):
         )
 
         if files:
-            # Filter already processed files
-            new_files = [f for f in files if f not in self.processed_files]
-            if new_files:
-                self.process_files(new_files)
+            self.process_files(files)
 
     def update_word_limit(self, value):
         """Update word limit setting."""
         self.settings.set("max_words", value)
-        self.settings.save()
+        self._schedule_settings_save()
+
+    def _schedule_settings_save(self):
+        """Save settings once edits pause (e.g. while typing a word limit)."""
+        self._save_timer.start()
+
+    def _flush_settings(self):
+        """Hand a snapshot of the current settings to the background writer."""
+        self._settings_pool.start(SettingsWriter(self.settings, self.settings.to_dict()))
 
     def browse_destination(self):
         """Browse for destination folder."""
+        from PyQt6.QtWidgets import QFileDialog
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Destination Folder",
-            self.settings.get("output_folder")
+            self.settings.get("output_folder"),
+            # Don't stat symlink targets (slow on network mounts)
+            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
         )
 
         if folder:
             self.settings.set("output_folder", folder)
-            self.settings.save()
-            self.splitter.current_output_folder = folder
+            self._schedule_settings_save()
             self.destination_btn.update_path(folder)
 
     def process_files(self, files):
         """Process files - maintains existing functionality."""
-        # Prevent starting a new batch while a current processing thread is active
-        if getattr(self, 'worker_thread', None) and self.worker_thread.isRunning():
+        # Single dedupe pass: drop repeats within the batch (keeping order)
+        # and files that already have a card
+        processed = self.processed_files
+        new_files = [f for f in dict.fromkeys(files) if f not in processed]
+        if not new_files:
             return
-        try:
-            # Add files to UI first
-            for file_path in files:
-                # Skip if already processed
-                if file_path in self.processed_files:
-                    continue
 
-                # Create file card
-                file_card = FileCard(file_path)
-
-                # Add to map and UI
-                self.processed_files[file_path] = file_card
-                self.files_layout.insertWidget(self.files_layout.count() - 1, file_card)
-
-            # Start worker thread if there are files to process
-            if files:
-                # Create thread and worker
-                self.worker_thread = QThread()
-                self.worker = Worker(self.splitter, files, self.settings)
-                self.worker.moveToThread(self.worker_thread)
-
-                # Connect signals
-                self.worker_thread.started.connect(self.worker.process)
-                self.worker.fileProgress.connect(self.update_file_progress)
-                self.worker.fileComplete.connect(self.mark_file_complete)
-                self.worker.fileError.connect(self.mark_file_error)
-                self.worker.finished.connect(self.worker_thread.quit)
-                self.worker_thread.finished.connect(self.worker.deleteLater)
-                # Remove automatic thread deletion to prevent premature deletion
-                # self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-                # Instead, clear the reference when finished
-                self.worker_thread.finished.connect(lambda: setattr(self, 'worker_thread', None))
-
-                # Start thread
-                self.worker_thread.start()
+        try:
+            # Add files to UI first - freeze repaints and layout so the
+            # whole batch is laid out once instead of once per card
+            self.files_list.setUpdatesEnabled(False)
+            self.files_layout.setEnabled(False)
+            jobs = []
+            try:
+                # Parse each new path once for both the card and the worker
+                jobs = [FileJob.from_path(file_path) for file_path in new_files]
+
+                # Fit all display names in one pass with a single font metrics object
+                display_names = FileCard.truncate_all(jobs, QFontMetrics(self.font()))
+
+                for job, display_name in zip(jobs, display_names):
+                    # Create file card already parented to the list, so inserting
+                    # it doesn't trigger a reparent (and its polish/events) per card
+                    file_card = FileCard(job, display_name, self.files_list)
+
+                    # Add to map and UI
+                    self.processed_files[job.path] = file_card
+                    self.files_layout.insertWidget(self.files_layout.count() - 1, file_card)
+            finally:
+                self.files_layout.setEnabled(True)
+                self.files_list.setUpdatesEnabled(True)
+                self.files_list.update()
+
+            # Queue the batch on the worker thread if there are files to process
+            if jobs:
+                self.jobsSubmitted.emit(jobs)
         except Exception as e:
             self.logger.exception(f"Error processing files: {str(e)}")
 
-    def update_file_progress(self, file_path, progress):
-        """Update progress for a file."""
-        if file_path in self.processed_files:
-            self.processed_files[file_path].update_progress(progress)
+    @pyqtSlot(dict, list)
+    def apply_worker_updates(self, progress_by_file, results):
+        """Apply one worker tick of progress and finished files, repainting the list once."""
+        if self.isMinimized():
+            # Nobody sees progress while minimized - keep only the latest value per
+            # file and apply it on restore. Results are still applied right away.
+            self._hidden_progress.update(progress_by_file)
+            progress_by_file = {}
+            for file_path, _, _ in results:
+                self._hidden_progress.pop(file_path, None)
+
+        cards = self.processed_files
+        self.files_list.setUpdatesEnabled(False)
+        try:
+            for file_path, progress in progress_by_file.items():
+                card = cards.get(file_path)
+                if card is not None:
+                    card.update_progress(progress)
+
+            for file_path, parts_count, error_message in results:
+                if error_message is None:
+                    self.mark_file_complete(file_path, parts_count)
+                else:
+                    self.mark_file_error(file_path, error_message)
+        finally:
+            self.files_list.setUpdatesEnabled(True)
 
     def mark_file_complete(self, file_path, parts_count):
         """Mark a file as completed."""
@@ -1113,17 +1467,10 @@ class FirstRunScreen(QMainWindow):
         super().__init__()
         self.setWindowTitle("Welcome to Manusplit")
         self.resize(500, 280)
-        self.output_path = os.path.join(os.path.expanduser("~"), "Documents", "Manusplit Files")
+        self.output_path = DEFAULT_OUTPUT_FOLDER
         self.result = False
 
-        # Set app style - darker theme
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #121212;
-                color: #ffffff;
-                font-family: Arial, sans-serif;
-            }
-        """)
+        # Dark theme comes from the application-wide APP_QSS set in main()
 
         self.setup_ui()
 
@@ -1139,11 +1486,7 @@ class FirstRunScreen(QMainWindow):
 
         # Description - direct approach
         desc_label = QLabel("Select where you'd like to save split documents")
-        desc_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 16px;
-            font-weight: 500;
-        """)
+        desc_label.setObjectName("firstRunTitle")
         desc_label.setWordWrap(True)
         main_layout.addWidget(desc_label)
 
@@ -1165,13 +1508,7 @@ class FirstRunScreen(QMainWindow):
         path_layout.setSpacing(10)
 
         self.path_label = QLabel(self.output_path)
-        self.path_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 14px;
-            background-color: #1a1a1a;
-            border-radius: 6px;
-            padding: 8px 12px;
-        """)
+        self.path_label.setObjectName("firstRunPath")
         self.path_label.setFixedHeight(36)
         path_layout.addWidget(self.path_label, 1)
 
@@ -1184,11 +1521,7 @@ class FirstRunScreen(QMainWindow):
 
         # Add note
         note_label = QLabel("This folder will be created if it doesn't exist")
-        note_label.setStyleSheet("""
-            color: #888888;
-            font-size: 13px;
-            font-style: italic;
-        """)
+        note_label.setObjectName("firstRunNote")
         content_layout.addWidget(note_label)
 
         # Add the content widget to main layout
@@ -1214,10 +1547,13 @@ class FirstRunScreen(QMainWindow):
 
     def browse_folder(self):
         """Browse for output folder."""
+        from PyQt6.QtWidgets import QFileDialog
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Output Folder",
-            self.output_path
+            self.output_path,
+            # Don't stat symlink targets (slow on network mounts)
+            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
         )
 
         if folder:
@@ -1233,60 +1569,48 @@ class FirstRunScreen(QMainWindow):
 # Utility functions
 def force_first_run():
     """Force first run dialog by renaming settings file."""
-    if os.path.exists("settings.json"):
-        try:
-            os.rename("settings.json", "settings.json.bak")
-            return True
-        except:
-            return False
+    try:
+        # os.replace overwrites an old backup (os.rename fails on Windows if it exists)
+        os.replace("settings.json", "settings.json.bak")
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
     return True
 
 
 def create_default_settings(output_path=None):
-    """Create default settings file."""
+    """Create default settings file (called on first run only)."""
     logger = logging.getLogger(__name__)
 
-    if not os.path.exists("settings.json"):
-        try:
-            # Set default path
-            if not output_path:
-                output_path = os.path.join(os.path.expanduser("~"), "Documents", "Manusplit Files")
-
-            # Create folder if needed
-            if not os.path.exists(output_path):
-                os.makedirs(output_path)
-
-            # Default settings - always preserve formatting and process all files
-            settings_dict = {
-                "max_words": 100000,
-                "output_folder": output_path,
-                "preserve_formatting": True,
-                "skip_under_limit": False
-            }
+    try:
+        # Set default path
+        if not output_path:
+            output_path = DEFAULT_OUTPUT_FOLDER
 
-            # Write settings
-            with open("settings.json", "w") as f:
-                json.dump(settings_dict, f, indent=4)
+        # Create the folder off the GUI thread; the worker also makes sure it
+        # exists before each batch, so nothing waits on this
+        QThreadPool.globalInstance().start(FolderCreator(output_path))
 
-            logger.info(f"Created settings with output folder: {output_path}")
-            return True
+        # Write settings compactly to a temporary file and swap it in, so an
+        # interrupted write never leaves a truncated settings file behind
+        with open("settings.json.tmp", "wb") as f:
+            f.write((_DEFAULT_SETTINGS_TEMPLATE % json.dumps(output_path)).encode("utf-8"))
+        os.replace("settings.json.tmp", "settings.json")
 
-        except Exception as e:
-            logger.warning(f"Failed to create settings: {str(e)}")
-            return False
+        logger.info(f"Created settings with output folder: {output_path}")
+        return True
 
-    return True
-
-
-def is_first_run():
-    """Check if this is the first run."""
-    return not os.path.exists("settings.json")
+    except Exception as e:
+        logger.warning(f"Failed to create settings: {str(e)}")
+        return False
 
 
 def main():
     """Application entry point."""
     # Set up logging
     logger = setup_logging()
+    import version
     logger.info(f"Starting Manusplit v{version.get_version()}")
 
     # Force first run if requested
@@ -1301,6 +1625,9 @@ def main():
     font = QFont("Arial", 10)
     app.setFont(font)
 
+    # Apply the dark theme once for every window
+    app.setStyleSheet(APP_QSS)
+
     # Add exception hook to log uncaught exceptions
     def exception_hook(exctype, value, tb):
         logger.critical(f"Uncaught exception: {value}")
@@ -1312,7 +1639,13 @@ def main():
     try:
         # Show first run dialog if needed
         output_path = None
-        if first_run := is_first_run():
+        try:
+            with open("settings.json", "rb"):
+                first_run = False
+        except FileNotFoundError:
+            first_run = True
+
+        if first_run:
             dialog = FirstRunScreen()
             dialog.show()
 
@@ -1323,18 +1656,17 @@ def main():
                 output_path = dialog.output_path
             else:
                 # Use default path if canceled
-                output_path = os.path.join(os.path.expanduser("~"), "Documents", "Manusplit Files")
+                output_path = DEFAULT_OUTPUT_FOLDER
 
-        # Create default settings
-        create_default_settings(output_path)
+            # Create default settings
+            create_default_settings(output_path)
 
         # Load settings
         settings = Settings()
         logger.info("Settings loaded")
 
-        # Ensure output directory exists
-        output_dir = Path(settings.get("output_folder"))
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # The output folder is created in the background on first run
+        # and by the worker before each batch, so no extra mkdir here
 
         # Create and show main window
         window = ManusplitApp(settings)
@@ -1349,4 +1681,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
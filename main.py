@@ -10,19 +10,24 @@ import os
 import sys
 import json
 import logging
-from pathlib import Path
+import multiprocessing
 
-# Local imports
-from settings import Settings
+# Local imports. gui (and with it PyQt6) is imported inside main(), so pool
+# processes that re-import this module when spawned don't load Qt.
+from settings import Settings, DEFAULT_OUTPUT_FOLDER
 from utils import setup_logging
-from gui import ManusplitApp
-import version
+
+# Directory containing this module, resolved once
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Window icon - .icns on macOS, .png on Windows/Linux
+_ICON_PATH = os.path.join(_MODULE_DIR, "assets", "icon2.icns" if sys.platform == 'darwin' else "icon.png")
 
 def get_resource_path():
     """Get the correct path for resources"""
     if 'MANUSPLIT_RESOURCES' in os.environ:
         return os.environ['MANUSPLIT_RESOURCES']
-    return os.path.dirname(os.path.abspath(__file__))
+    return _MODULE_DIR
 
 def get_settings_path():
     """Get the correct path for settings.json"""
@@ -35,32 +40,45 @@ def create_default_settings_if_needed():
     logger = logging.getLogger(__name__)
 
     # Only create if settings file doesn't exist
-    if not os.path.exists(settings_path):
-        try:
-            # Import Settings class defaults
-            default_settings = Settings.DEFAULT_SETTINGS.copy()
+    try:
+        os.stat(settings_path)
+        return True  # Settings already exist
+    except FileNotFoundError:
+        pass
 
-            # Only override output path
-            default_output_path = os.path.join(os.path.expanduser("~"), "Documents", "Manusplit Files")
-            default_settings["output_folder"] = default_output_path
+    try:
+        # Import Settings class defaults
+        default_settings = Settings.DEFAULT_SETTINGS.copy()
 
-            # Create folder if needed
-            os.makedirs(default_output_path, exist_ok=True)
+        # Only override output path
+        default_output_path = DEFAULT_OUTPUT_FOLDER
+        default_settings["output_folder"] = default_output_path
 
-            # Write settings file
-            with open(settings_path, "w") as f:
-                json.dump(default_settings, f, indent=4)
+        # Create folder if needed
+        os.makedirs(default_output_path, exist_ok=True)
 
-            logger.info(f"Created settings with output folder: {default_output_path}")
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to create settings: {str(e)}")
-            return False
-    return True  # Settings already exist
+        # Write settings file via a temporary file so it is never left half-written
+        tmp_path = settings_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(default_settings, separators=(",", ":")).encode("utf-8"))
+        os.replace(tmp_path, settings_path)
+
+        logger.info(f"Created settings with output folder: {default_output_path}")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to create settings: {str(e)}")
+        return False
 
 
 def main():
     """Main entry point."""
+    import version
+
+    # Print the version without starting the GUI
+    if "--version" in sys.argv:
+        print(version.get_version())
+        return
+
     # Set up logging
     logger = setup_logging()
     logger.info(f"Starting Manusplit v{version.get_version()}")
@@ -68,17 +86,13 @@ def main():
     try:
         # Create PyQt application
         from PyQt6.QtWidgets import QApplication
+        from gui import ManusplitApp, APP_QSS
         app = QApplication(sys.argv)
 
         # Use appropriate icon format based on platform
-        if sys.platform == 'darwin':  # macOS
-            icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icon2.icns")
-        else:  # Windows/Linux
-            icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icon.png")
-
-        if os.path.exists(icon_path):
+        if os.path.exists(_ICON_PATH):
             from PyQt6.QtGui import QIcon
-            app.setWindowIcon(QIcon(icon_path))
+            app.setWindowIcon(QIcon(_ICON_PATH))
 
         # Create default settings if needed (without showing any dialog)
         create_default_settings_if_needed()
@@ -87,12 +101,12 @@ def main():
         settings = Settings()
         logger.info("Settings loaded")
 
-        # Ensure output directory exists
-        output_dir = Path(settings.get("output_folder"))
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # The output folder is created with the settings file on first run
+        # and by the worker before each batch, so no extra mkdir here
 
         # Set application style
         app.setStyle("Fusion")
+        app.setStyleSheet(APP_QSS)
 
         # Create and show the main window
         window = ManusplitApp(settings)
@@ -108,4 +122,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
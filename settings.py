@@ -6,6 +6,41 @@ import json
 import os
 import logging
 from pathlib import Path
+from types import MappingProxyType
+
+# Default destination for split files, resolved once
+DEFAULT_OUTPUT_FOLDER = os.path.join(os.path.expanduser("~"), "Documents", "Manusplit Files")
+
+
+def _compile_constraints(constraints):
+    """
+    Turn a constraints dict into a single validator function.
+
+    Args:
+        constraints (dict): Optional "type", "min" and "max" entries
+
+    Returns:
+        callable: Function taking a value and returning True if it is valid
+    """
+    value_type = constraints.get("type")
+    minimum = constraints.get("min")
+    maximum = constraints.get("max")
+
+    def validate(value):
+        # Check type
+        if value_type is not None and not isinstance(value, value_type):
+            return False
+
+        # Check min/max for numeric values
+        if isinstance(value, (int, float)):
+            if minimum is not None and value < minimum:
+                return False
+            if maximum is not None and value > maximum:
+                return False
+
+        return True
+
+    return validate
 
 
 class Settings:
@@ -28,6 +63,9 @@ class Settings:
         }
     }
 
+    # Validator per constrained key, compiled once from CONSTRAINTS
+    _VALIDATORS = {key: _compile_constraints(c) for key, c in CONSTRAINTS.items()}
+
     def __init__(self, config_path=None):
         """Initialize settings with optional custom config path."""
         self.logger = logging.getLogger(__name__)
@@ -47,37 +85,49 @@ class Settings:
     def load(self):
         """Load settings from file, falling back to defaults if necessary."""
         try:
-            if self.config_path.exists():
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    loaded_settings = json.load(f)
-
-                # Update settings with loaded values (keeping defaults for missing keys)
-                for key, value in loaded_settings.items():
-                    if key in self.settings:
-                        # Validate the setting before accepting it
-                        if self._validate_setting(key, value):
-                            self.settings[key] = value
-                        else:
-                            self.logger.warning(f"Invalid setting value for {key}: {value}, using default")
-
-                self.logger.info("Settings loaded successfully")
-            else:
-                self.logger.info("No settings file found, using defaults")
-                # Create output folder if it doesn't exist
-                self._ensure_output_folder()
+            # Open directly rather than checking exists() first - one syscall, no race
+            with open(self.config_path, "rb") as f:
+                loaded_settings = json.loads(f.read())
+
+            # Update settings with loaded values (keeping defaults for missing keys).
+            # Unknown keys are dropped in one set intersection.
+            for key in self.settings.keys() & loaded_settings.keys():
+                value = loaded_settings[key]
+                # Validate the setting before accepting it
+                if self._validate_setting(key, value):
+                    self.settings[key] = value
+                else:
+                    self.logger.warning(f"Invalid setting value for {key}: {value}, using default")
+
+            self.logger.info("Settings loaded successfully")
+
+        except FileNotFoundError:
+            self.logger.info("No settings file found, using defaults")
+            # Create output folder if it doesn't exist
+            self._ensure_output_folder()
 
         except (json.JSONDecodeError, IOError) as e:
             self.logger.error(f"Error loading settings: {str(e)}")
             # Continue with defaults
 
-    def save(self):
-        """Save current settings to file."""
+    def save(self, snapshot=None):
+        """
+        Save settings to file.
+
+        Args:
+            snapshot (dict): Optional copy of the settings to write (see to_dict),
+                             so the write can happen on another thread
+        """
+        data = self.settings if snapshot is None else snapshot
         try:
             # Ensure parent directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=4)
+            # Write to a temporary file and swap it in, so a reader never sees a partial file
+            tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_path, self.config_path)
 
             self.logger.info("Settings saved successfully")
             return True
@@ -89,6 +139,17 @@ class Settings:
         """Get a setting value with optional default."""
         return self.settings.get(key, default)
 
+    def to_dict(self):
+        """Return a plain copy of the current settings."""
+        return dict(self.settings)
+
+    def view(self):
+        """Return a live, read-only view of the settings (no copy, no per-key lookup).
+
+        Later set() calls show through; use to_dict() for point-in-time values.
+        """
+        return MappingProxyType(self.settings)
+
     def set(self, key, value):
         """Set a setting value with validation."""
         if key not in self.settings:
@@ -119,21 +180,8 @@ class Settings:
             return False
 
         # Apply specific constraints if defined
-        if key in self.CONSTRAINTS:
-            constraints = self.CONSTRAINTS[key]
-
-            # Check type
-            if "type" in constraints and not isinstance(value, constraints["type"]):
-                return False
-
-            # Check min/max for numeric values
-            if isinstance(value, (int, float)):
-                if "min" in constraints and value < constraints["min"]:
-                    return False
-                if "max" in constraints and value > constraints["max"]:
-                    return False
-
-        return True
+        validator = self._VALIDATORS.get(key)
+        return validator is None or validator(value)
 
     def _ensure_output_folder(self):
         """Ensure the output folder exists."""
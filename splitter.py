@@ -2,15 +2,79 @@
 Document processing and splitting logic for Manusplit.
 Handles the core functionality of splitting documents by word count.
 """
+import io
 import os
 import logging
-import re
+import time
 from pathlib import Path
-from docx import Document
 import utils
 from typing import List, Tuple, Dict, Generator, Union
 
 
+# Serialized blank document used for every output part, built on first use
+_BLANK_DOCX = None
+
+
+def _blank_document():
+    """
+    Create a new empty DOCX document.
+
+    Document() opens and unzips python-docx's bundled template on every call;
+    the template is read once per process and each part loads from memory.
+
+    Returns:
+        Document: New empty document
+    """
+    global _BLANK_DOCX
+    from docx import Document
+
+    if _BLANK_DOCX is None:
+        buffer = io.BytesIO()
+        Document().save(buffer)
+        _BLANK_DOCX = buffer.getvalue()
+    return Document(io.BytesIO(_BLANK_DOCX))
+
+
+# Compiled XPath queries for _paragraph_text, built on first use
+_TEXT_XPATH = None
+_SPECIAL_XPATH = None
+
+
+def _paragraph_text(para) -> str:
+    """
+    Read a paragraph's text straight from its XML.
+
+    para.text wraps every run and text node in a python-docx element object;
+    joining the w:t text nodes from one compiled XPath gives the same string
+    without that. Paragraphs containing tabs, breaks or non-breaking hyphens
+    still go through para.text so they are mapped exactly as before.
+
+    Args:
+        para: Paragraph object
+
+    Returns:
+        str: Paragraph text, identical to para.text
+    """
+    global _TEXT_XPATH, _SPECIAL_XPATH
+    if _TEXT_XPATH is None:
+        from lxml import etree
+        from docx.oxml.ns import nsmap
+
+        namespaces = {"w": nsmap["w"]}
+        _TEXT_XPATH = etree.XPath(
+            "./w:r/w:t/text() | ./w:hyperlink/w:r/w:t/text()",
+            namespaces=namespaces)
+        special = "w:br or w:cr or w:noBreakHyphen or w:ptab or w:tab"
+        _SPECIAL_XPATH = etree.XPath(
+            f"boolean(./w:r[{special}] | ./w:hyperlink/w:r[{special}])",
+            namespaces=namespaces)
+
+    p = para._p
+    if _SPECIAL_XPATH(p):
+        return para.text
+    return "".join(_TEXT_XPATH(p))
+
+
 class DocumentSplitter:
     """Handles splitting documents into smaller parts based on word count."""
 
@@ -27,7 +91,7 @@ class DocumentSplitter:
         # Add a current_output_folder attribute that will be set by Worker
         self.current_output_folder = settings.get("output_folder")
 
-    def process_file(self, file_path: str, callback=None) -> Dict:
+    def process_file(self, file_path: str, callback=None, output_folder=None) -> Dict:
         """
         Process a single file, splitting it if needed.
 
@@ -35,6 +99,9 @@ class DocumentSplitter:
             file_path (str): Path to file to process
             callback (callable): Optional callback function for progress updates
                                 Function signature: callback(status, progress, message)
+            output_folder (str): Optional destination folder; defaults to
+                                current_output_folder. Passing it explicitly lets
+                                several files be processed concurrently.
 
         Returns:
             dict: Processing results with stats
@@ -57,19 +124,20 @@ class DocumentSplitter:
 
         # Check if this is already a split file (contains "- Part X" in the filename)
         basename = os.path.basename(file_path)
-        if re.search(r'- Part \d+\.\w+$', basename):
+        if utils.is_part_file(basename):
             self.logger.info(f"File appears to be a split part already: {basename}")
             # We could add a warning or special handling here
 
-        # Determine file type and use appropriate handler
+        # Determine file type and use appropriate handler (from the name already
+        # split off above, rather than lowercasing the whole path)
         file_path = str(file_path)  # Ensure string
-        _, ext = os.path.splitext(file_path.lower())
+        ext = os.path.splitext(basename)[1].lower()
 
         try:
             if ext == ".docx":
-                return self._process_docx(file_path, callback)
+                return self._process_docx(file_path, callback, output_folder)
             elif ext == ".txt":
-                return self._process_txt(file_path, callback)
+                return self._process_txt(file_path, callback, output_folder)
             else:
                 result["message"] = f"Unsupported file type: {ext}"
                 self.logger.warning(f"Unsupported file type: {ext}")
@@ -79,13 +147,14 @@ class DocumentSplitter:
             result["message"] = f"Error: {str(e)}"
             return result
 
-    def _process_docx(self, file_path: str, callback=None) -> Dict:
+    def _process_docx(self, file_path: str, callback=None, output_folder=None) -> Dict:
         """
         Process a DOCX file.
 
         Args:
             file_path (str): Path to DOCX file
             callback (callable): Progress callback
+            output_folder (str): Destination folder (defaults to current_output_folder)
 
         Returns:
             dict: Processing results
@@ -100,15 +169,20 @@ class DocumentSplitter:
         }
 
         try:
+            # python-docx (and lxml) load on the first DOCX only, so TXT-only runs
+            # and processes that never split a DOCX don't pay for the import
+            from docx import Document
+
             # Load document
             if callback:
                 callback("loading", 0, f"Loading {os.path.basename(file_path)}...")
 
             doc = Document(file_path)
 
-            # Count total words
-            paragraphs = list(self._get_docx_paragraphs(doc))
-            total_words = sum(utils.count_words(p.text) for p in paragraphs)
+            # Count each paragraph's words once; the split loop reuses them
+            paragraphs = [(para, text, utils.count_words(text))
+                          for para, text in self._get_docx_paragraphs(doc)]
+            total_words = sum(words for _, _, words in paragraphs)
             result["total_words"] = total_words
 
             # Check if splitting is needed
@@ -125,33 +199,41 @@ class DocumentSplitter:
 
             # Prepare for splitting
             # Use current_output_folder instead of settings.get("output_folder")
-            output_folder = self.current_output_folder
+            if output_folder is None:
+                output_folder = self.current_output_folder
+            # Parse the source name once; each part only fills in its number
+            part_path = utils.output_filename_factory(file_path, output_folder)
             preserve_formatting = self.settings.get("preserve_formatting")
 
             # Start splitting
             part_num = 1
-            current_doc = Document()
+            current_doc = _blank_document()
             current_words = 0
             progress_count = 0
+            paragraph_count = len(paragraphs)
+            # Progress follows words rather than paragraphs, so long paragraphs
+            # advance it in proportion to the work they take
+            words_done = 0
+            word_total = total_words or 1
 
-            for i, para in enumerate(paragraphs):
+            for i, (para, para_text, para_words) in enumerate(paragraphs):
                 # Calculate progress
-                progress = min(100, int((i / len(paragraphs)) * 100))
+                progress = (words_done * 100) // word_total
+                words_done += para_words
+                # Only report (and build the message) when the percentage advances;
+                # split_file rate-limits what actually reaches the GUI
                 if callback and progress > progress_count:
                     progress_count = progress
-                    callback("processing", progress, f"Processing paragraph {i+1} of {len(paragraphs)}...")
-
-                # Get word count for this paragraph
-                para_words = utils.count_words(para.text)
+                    callback("processing", progress, f"Processing paragraph {i+1} of {paragraph_count}...")
 
                 # Skip empty paragraphs
-                if para_words == 0 and not para.text.strip():
+                if para_words == 0 and not para_text.strip():
                     continue
 
                 # Check if adding this paragraph would exceed the limit
                 if current_words + para_words > max_words and current_words > 0:
                     # Save current document
-                    output_path = utils.get_output_filename(file_path, part_num, output_folder)
+                    output_path = part_path(part_num)
                     if callback:
                         callback("saving", progress, f"Saving part {part_num}...")
 
@@ -160,7 +242,7 @@ class DocumentSplitter:
 
                     # Start a new document
                     part_num += 1
-                    current_doc = Document()
+                    current_doc = _blank_document()
                     current_words = 0
 
                 # Add paragraph to current document
@@ -172,28 +254,23 @@ class DocumentSplitter:
                         new_para.style = para.style
 
                     # Try to preserve basic formatting (bold, italic, etc.)
-                    for run in para.runs:
-                        r = new_para.add_run(run.text)
-                        r.bold = run.bold
-                        r.italic = run.italic
-                        r.underline = run.underline
-
-                        # Clone other run properties if available
-                        if hasattr(run, 'font') and run.font:
-                            if hasattr(run.font, 'size') and run.font.size:
-                                r.font.size = run.font.size
-                            if hasattr(run.font, 'name') and run.font.name:
-                                r.font.name = run.font.name
+                    runs = para.runs
+                    formats = [self._run_format(run) for run in runs]
+                    if len(formats) > 1 and all(f == formats[0] for f in formats):
+                        # Uniform formatting (the usual case) - one run for the whole text
+                        self._add_run(new_para, "".join(run.text for run in runs), formats[0])
+                    else:
+                        for run, run_format in zip(runs, formats):
+                            self._add_run(new_para, run.text, run_format)
                 else:
                     # Add as plain text - ensure no extra periods
-                    text = para.text.strip()
-                    current_doc.add_paragraph(text)
+                    current_doc.add_paragraph(para_text.strip())
 
                 current_words += para_words
 
             # Save the last part
             if current_words > 0:
-                output_path = utils.get_output_filename(file_path, part_num, output_folder)
+                output_path = part_path(part_num)
                 if callback:
                     callback("saving", 100, f"Saving part {part_num}...")
 
@@ -217,13 +294,14 @@ class DocumentSplitter:
                 callback("error", 100, f"Error: {str(e)}")
             return result
 
-    def _process_txt(self, file_path: str, callback=None) -> Dict:
+    def _process_txt(self, file_path: str, callback=None, output_folder=None) -> Dict:
         """
         Process a TXT file.
 
         Args:
             file_path (str): Path to TXT file
             callback (callable): Progress callback
+            output_folder (str): Destination folder (defaults to current_output_folder)
 
         Returns:
             dict: Processing results
@@ -249,12 +327,15 @@ class DocumentSplitter:
             paragraphs = content.split('\n\n')
             if len(paragraphs) == 1:  # If no double newlines, try single newlines
                 paragraphs = content.split('\n')
+            # The raw text is no longer needed - free it before building parts
+            del content
 
-            # Remove empty paragraphs and clean up each paragraph
-            paragraphs = [p.strip() for p in paragraphs if p.strip()]
+            # Remove empty paragraphs and clean up each paragraph, counting the
+            # words of each once for both the total and the split loop
+            paragraphs = [(p, utils.count_words(p)) for p in map(str.strip, paragraphs) if p]
 
             # Count total words
-            total_words = sum(utils.count_words(p) for p in paragraphs)
+            total_words = sum(words for _, words in paragraphs)
             result["total_words"] = total_words
 
             # Check if splitting is needed
@@ -271,36 +352,40 @@ class DocumentSplitter:
 
             # Prepare for splitting
             # Use current_output_folder instead of settings.get("output_folder")
-            output_folder = self.current_output_folder
+            if output_folder is None:
+                output_folder = self.current_output_folder
+            # Parse the source name once; each part only fills in its number
+            part_path = utils.output_filename_factory(file_path, output_folder)
 
             # Start splitting
             part_num = 1
             current_content = []
             current_words = 0
             progress_count = 0
+            paragraph_count = len(paragraphs)
+            # Progress follows words rather than paragraphs, so long paragraphs
+            # advance it in proportion to the work they take
+            words_done = 0
+            word_total = total_words or 1
 
-            for i, para in enumerate(paragraphs):
+            for i, (para, para_words) in enumerate(paragraphs):
                 # Calculate progress
-                progress = min(100, int((i / len(paragraphs)) * 100))
+                progress = (words_done * 100) // word_total
+                words_done += para_words
+                # Only report (and build the message) when the percentage advances;
+                # split_file rate-limits what actually reaches the GUI
                 if callback and progress > progress_count:
                     progress_count = progress
-                    callback("processing", progress, f"Processing paragraph {i+1} of {len(paragraphs)}...")
-
-                # Get word count for this paragraph
-                para_words = utils.count_words(para)
+                    callback("processing", progress, f"Processing paragraph {i+1} of {paragraph_count}...")
 
                 # Check if adding this paragraph would exceed the limit
                 if current_words + para_words > max_words and current_words > 0:
                     # Save current content
-                    output_path = utils.get_output_filename(file_path, part_num, output_folder)
+                    output_path = part_path(part_num)
                     if callback:
                         callback("saving", progress, f"Saving part {part_num}...")
 
-                    # Join with clean separators - ensure no extra line breaks
-                    output_text = '\n\n'.join(current_content)
-
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(output_text)
+                    self._write_txt_part(output_path, current_content)
 
                     result["output_files"].append(str(output_path))
 
@@ -309,21 +394,17 @@ class DocumentSplitter:
                     current_content = []
                     current_words = 0
 
-                # Add paragraph to current content - ensure it's clean
-                current_content.append(para.strip())
+                # Add paragraph to current content (already stripped)
+                current_content.append(para)
                 current_words += para_words
 
             # Save the last part
             if current_content:
-                output_path = utils.get_output_filename(file_path, part_num, output_folder)
+                output_path = part_path(part_num)
                 if callback:
                     callback("saving", 100, f"Saving part {part_num}...")
 
-                # Join with clean separators
-                output_text = '\n\n'.join(current_content)
-
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(output_text)
+                self._write_txt_part(output_path, current_content)
 
                 result["output_files"].append(str(output_path))
 
@@ -344,25 +425,131 @@ class DocumentSplitter:
                 callback("error", 100, f"Error: {str(e)}")
             return result
 
+    def _run_format(self, run) -> Tuple:
+        """
+        Get the formatting copied from a run.
+
+        Args:
+            run: Source Run object
+
+        Returns:
+            tuple: (bold, italic, underline, font size, font name)
+        """
+        font = run.font
+        return run.bold, run.italic, run.underline, font.size, font.name
+
+    def _add_run(self, paragraph, text: str, run_format: Tuple):
+        """
+        Add a run with copied formatting to a paragraph.
+
+        Args:
+            paragraph: Destination Paragraph object
+            text (str): Run text
+            run_format (tuple): Formatting from _run_format
+        """
+        bold, italic, underline, size, name = run_format
+        r = paragraph.add_run(text)
+        r.bold = bold
+        r.italic = italic
+        r.underline = underline
+
+        # Clone other run properties if set
+        if size:
+            r.font.size = size
+        if name:
+            r.font.name = name
+
+    def _write_txt_part(self, output_path, paragraphs: List[str]):
+        """
+        Write one TXT part, paragraphs separated by a blank line.
+
+        Paragraphs are streamed through a large write buffer instead of being
+        joined into one string first, so a part is never held twice in memory.
+
+        Args:
+            output_path: Destination file path
+            paragraphs (list): Cleaned paragraph strings
+        """
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write = f.write
+            remaining = iter(paragraphs)
+            write(next(remaining))
+            for para in remaining:
+                write('\n\n')
+                write(para)
+
     def _get_docx_paragraphs(self, doc) -> Generator:
         """
         Extract all paragraphs from a DOCX document, including tables.
 
+        The text is read once here, from the XML via _paragraph_text, and
+        handed on with the paragraph.
+
         Args:
             doc: Document object
 
         Yields:
-            Paragraph objects
+            (Paragraph, str) tuples of each non-empty paragraph and its text
         """
         # Process regular paragraphs
         for para in doc.paragraphs:
-            if para.text.strip():  # Skip empty paragraphs
-                yield para
+            text = _paragraph_text(para)
+            if text and not text.isspace():  # Skip empty paragraphs
+                yield para, text
 
         # Process tables
         for table in doc.tables:
             for row in table.rows:
                 for cell in row.cells:
                     for para in cell.paragraphs:
-                        if para.text.strip():  # Skip empty cells
-                            yield para
\ No newline at end of file
+                        text = _paragraph_text(para)
+                        if text and not text.isspace():  # Skip empty cells
+                            yield para, text
+
+
+# Progress queue shared with the parent when running inside a process pool
+_progress_queue = None
+
+# Minimum seconds between progress updates sent to the parent (~30 Hz)
+PROGRESS_INTERVAL = 1 / 30
+
+
+def init_process_worker(progress_queue, log_queue):
+    """
+    Initializer for pool processes.
+
+    Args:
+        progress_queue: multiprocessing.Queue that receives (file_path, progress) tuples
+        log_queue: multiprocessing.Queue that carries log records to the main process
+    """
+    global _progress_queue
+    _progress_queue = progress_queue
+    utils.setup_worker_logging(log_queue)
+
+
+def split_file(file_path: str, settings: Dict, output_folder: str) -> Dict:
+    """
+    Split a single file in a pool process.
+
+    Args:
+        file_path (str): Path to file to process
+        settings (dict): Plain settings dict (cheap to pickle, unlike Settings)
+        output_folder (str): Destination folder for the parts
+
+    Returns:
+        dict: Processing results with stats
+    """
+    callback = None
+    if _progress_queue is not None:
+        progress_queue = _progress_queue
+        last_put = 0.0
+
+        def callback(status, progress, message):
+            # Throttle before pickling anything onto the inter-process queue
+            nonlocal last_put
+            now = time.monotonic()
+            if progress >= 100 or now - last_put >= PROGRESS_INTERVAL:
+                last_put = now
+                progress_queue.put((file_path, progress))
+
+    return DocumentSplitter(settings).process_file(file_path, callback, output_folder)
@@ -2,11 +2,28 @@
 Helper functions for Manusplit application.
 Provides common utility functions for validation, error handling, etc.
 """
+import atexit
 import os
 import logging
 import re
+import stat
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler, QueueHandler
+
+# Characters not allowed in filenames on at least one platform
+_INVALID_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+
+# "- Part N.ext" suffix of an existing split part (extension captured)
+_PART_SUFFIX_RE = re.compile(r'- Part \d+(\.\w+)$')
+
+# Standalone dashes between spaces ("word - word") are not words
+_DASH_RE = re.compile(r'\s[-–—]\s')
+
+# Word boundaries inside a token: closing punctuation followed by a word
+# character, and an opening bracket/quote preceded by one. Each pattern starts
+# with its (rare) punctuation class so the regex engine can skip ahead to it.
+_PUNCT_WORD_RE = re.compile(r'[,.;:!?)\]}"](?=\w)')
+_WORD_OPEN_RE = re.compile(r'[(\[{"](?<=\w.)')
 
 
 def setup_logging():
@@ -27,12 +44,39 @@ def setup_logging():
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
     
+    # Buffer records and write them to the file in small batches; errors are
+    # written straight away. The buffer is kept small so a hard crash loses
+    # little context, and is flushed explicitly at interpreter exit.
+    buffered_handler = MemoryHandler(
+        capacity=32, flushLevel=logging.ERROR, target=file_handler
+    )
+    buffered_handler.setLevel(logging.INFO)
+    atexit.register(buffered_handler.flush)
+    
     # Add handler to logger
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_handler)
     
     return logger
 
 
+def setup_worker_logging(log_queue):
+    """
+    Send a pool process's log records to the main process.
+
+    Pool processes have no file handler of their own (spawned ones start with
+    no handlers at all); a QueueListener in the main process writes the
+    records to manusplit.log.
+
+    Args:
+        log_queue: multiprocessing.Queue read by the main process's listener
+    """
+    logger = logging.getLogger()
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+
+
 def sanitize_filename(filename):
     """
     Clean up a filename to ensure it's valid on all platforms.
@@ -44,7 +88,7 @@ def sanitize_filename(filename):
         str: Sanitized filename
     """
     # Remove invalid characters
-    sanitized = re.sub(r'[\\/*?:"<>|]', "", filename)
+    sanitized = _INVALID_FILENAME_RE.sub("", filename)
     
     # Trim whitespace and periods from the end (Windows issue)
     sanitized = sanitized.strip().rstrip(".")
@@ -69,13 +113,31 @@ def get_output_filename(original_path, part_num, output_folder, max_length=200):
     Returns:
         Path: Complete path to the output file
     """
+    return output_filename_factory(original_path, output_folder, max_length)(part_num)
+
+
+def output_filename_factory(original_path, output_folder, max_length=200):
+    """
+    Prepare output filenames for all parts of one document.
+
+    The name parsing is done once; the returned function only fills in the
+    part number.
+
+    Args:
+        original_path (str): Path to the original document
+        output_folder (str): Destination folder
+        max_length (int): Maximum filename length
+
+    Returns:
+        callable: Function taking a part number (1-based) and returning its Path
+    """
     # Extract just the filename without path
     original_name = os.path.basename(original_path)
     
-    # Check if this is already a split file (has "- Part X" in the name)
-    if re.search(r'- Part \d+\.\w+$', original_name):
-        # Remove existing part number from filename
-        original_name = re.sub(r'- Part \d+(\.\w+)$', r'\1', original_name)
+    # If this is already a split file (has "- Part X" in the name),
+    # remove the existing part number from the filename
+    if '- Part ' in original_name:
+        original_name = _PART_SUFFIX_RE.sub(r'\1', original_name)
 
     # Get base name without extension
     base_name, extension = os.path.splitext(original_name)
@@ -84,20 +146,23 @@ def get_output_filename(original_path, part_num, output_folder, max_length=200):
     if len(base_name) > max_length - 15:  # Account for " - Part X" and extension
         base_name = base_name[:max_length - 15] + "..."
 
-    # Create the new filename with part number
-    new_filename = f"{base_name} - Part {part_num}{extension}"
+    folder = Path(output_folder)
 
-    # Sanitize it
-    new_filename = sanitize_filename(new_filename)
+    def part_path(part_num):
+        # Create the new filename with part number, sanitize it and join with output folder
+        return folder / sanitize_filename(f"{base_name} - Part {part_num}{extension}")
 
-    # Join with output folder
-    return Path(output_folder) / new_filename
+    return part_path
 
 
 def count_words(text):
     """
     Count words in a text using a method similar to Word/Pages.
 
+    Rather than rewriting the text and splitting it, the count is taken from
+    the whitespace-separated tokens, corrected by scans for standalone dashes
+    and for punctuation boundaries inside tokens.
+
     Args:
         text (str): Input text
 
@@ -107,50 +172,20 @@ def count_words(text):
     if not text:
         return 0
 
-    # Prepare text for more accurate counting
-    # 1. Handle special characters that affect word boundaries
-
-    # Replace non-breaking spaces with regular spaces
-    text = text.replace('\xa0', ' ')
-
-    # Replace various dashes and hyphens with spaces when they separate words
-    text = re.sub(r'\s[-–—]\s', ' ', text)  # Replace "word - word" with "word word"
-
-    # 2. Preserve hyphenated words (count as one word)
-    text = re.sub(r'(\w+)-(\w+)', r'\1_HYPHEN_\2', text)  # Temporarily mark hyphenated words
-
-    # 3. Ensure punctuation doesn't affect word count by adding spaces
-    # Add space after punctuation if followed by a word character
-    text = re.sub(r'([,.;:!?)\]}"])([\w])', r'\1 \2', text)
-
-    # Add space before punctuation if preceded by a word character
-    text = re.sub(r'([\w])([([{"])', r'\1 \2', text)
+    # 1. Whitespace-separated tokens (non-breaking spaces count as whitespace,
+    #    hyphenated words stay one token)
+    count = len(text.split())
 
-    # 4. Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    # 2. A dash surrounded by whitespace separates words but is not one itself
+    count -= len(_DASH_RE.findall(text))
 
-    # 5. Split and count
-    words = [w for w in text.split() if w]
+    # 3. Punctuation splits a token where a word starts right after it
+    #    ("end.Next") or an opening bracket/quote follows a word ("word(s)").
+    #    A '"' between two words counts for both.
+    count += len(_PUNCT_WORD_RE.findall(text))
+    count += len(_WORD_OPEN_RE.findall(text))
 
-    # 6. Restore hyphenated words (they count as one word)
-    words = [w.replace('_HYPHEN_', '-') for w in words]
-
-    # 7. Additional rules for more accurate counting
-    # Count contractions correctly
-    contraction_count = len(re.findall(r'\b\w+\'[a-z]+\b', text))  # e.g., don't, I'll
-
-    # Count abbreviations correctly
-    abbrev_count = len(re.findall(r'\b(?:[A-Z]\.){2,}', text))  # e.g., U.S.A.
-
-    # Apply adjustments - for now we're keeping it simple
-    adjusted_count = len(words)
-
-    # Log very large disparities for debugging
-    logger = logging.getLogger(__name__)
-    if len(words) > 1000 and abs(adjusted_count - len(words)) > 100:
-        logger.info(f"Word count adjustment: {len(words)} -> {adjusted_count}")
-
-    return adjusted_count
+    return count
 
 
 def format_word_count(count):
@@ -176,17 +211,23 @@ def check_file_access(filepath):
     Returns:
         tuple: (bool success, str error_message)
     """
-    path = Path(filepath)
-
-    if not path.exists():
+    # One stat answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(filepath)
+    except (FileNotFoundError, NotADirectoryError):
         return False, "File not found"
+    except PermissionError:
+        return False, "Permission denied"
+    except OSError:
+        return False, "I/O error (file may be locked)"
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, "Not a file"
 
     try:
-        # Try opening for reading
-        with open(path, 'rb'):
+        # Try opening for reading; unlike os.access this also catches files
+        # locked by another program (e.g. open in Word on Windows)
+        with open(filepath, 'rb'):
             pass
         return True, ""
     except PermissionError:
@@ -205,4 +246,5 @@ def is_part_file(filename):
     Returns:
         bool: True if the file appears to be a split part
     """
-    return bool(re.search(r'- Part \d+\.\w+$', filename))
\ No newline at end of file
+    # Plain substring test first; only names containing it need the regex
+    return '- Part ' in filename and _PART_SUFFIX_RE.search(filename) is not None
\ No newline at end of file